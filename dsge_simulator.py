@@ -3,8 +3,11 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from plotly.subplots import make_subplots
 import scipy.stats as stats
+from scipy.sparse import csr_matrix
+from numba import njit
+import string
+from collections import OrderedDict
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -17,42 +20,173 @@ st.set_page_config(
 )
 
 # CSS personnalisé
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        background: linear-gradient(45deg, #0072CE, #009639, #CE1126);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
-        padding: 1rem;
-        color: white;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    .analysis-section {
-        background: #f8f9fa;
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border-left: 4px solid #0072CE;
-    }
-    .shock-card {
-        background: white;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-left: 4px solid;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _static_css():
+    """Feuille de style de l'application, construite une seule fois"""
+    return """
+    <style>
+        .main-header {
+            font-size: 3rem;
+            background: linear-gradient(45deg, #0072CE, #009639, #CE1126);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            text-align: center;
+            margin-bottom: 2rem;
+        }
+        .metric-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            border-radius: 10px;
+            padding: 1rem;
+            color: white;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }
+        .analysis-section {
+            background: #f8f9fa;
+            border-radius: 10px;
+            padding: 1.5rem;
+            margin: 1rem 0;
+            border-left: 4px solid #0072CE;
+        }
+        .shock-card {
+            background: white;
+            border-radius: 10px;
+            padding: 1rem;
+            margin: 0.5rem 0;
+            border-left: 4px solid;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+    </style>
+    """
+
+st.markdown(_static_css(), unsafe_allow_html=True)
+
+# Matrice de transition 15x15 avec structure économiquement cohérente (construite une seule fois)
+# Simple précision : coefficients à 2 décimales, résultats affichés à 3 décimales
+_A_TRANSITION = np.array([
+    # PIB, Cons, Inv, Inf, Taux, Sal, Trav, NX, Dep, Tax, Dette, Créd, Spr, TCR, OG
+    [0.85, 0.15, 0.20, -0.05, -0.12, 0.08, 0.12, 0.05, 0.08, 0.02, -0.01, 0.15, -0.03, 0.06, 0.10],  # PIB
+    [0.25, 0.75, 0.08, -0.03, -0.08, 0.12, 0.06, 0.02, 0.04, -0.02, 0.00, 0.08, -0.02, 0.03, 0.05],  # Consommation
+    [0.15, 0.05, 0.65, -0.02, -0.15, 0.10, 0.15, 0.03, 0.06, -0.01, 0.00, 0.25, -0.04, 0.04, 0.08],  # Investissement
+    [0.08, 0.03, 0.02, 0.55, 0.20, 0.05, 0.03, 0.02, 0.04, 0.02, 0.02, 0.03, 0.08, 0.12, 0.06],     # Inflation
+    [0.06, 0.02, 0.02, 0.25, 0.75, 0.02, 0.02, 0.01, 0.02, 0.01, 0.02, 0.02, 0.12, 0.08, 0.15],     # Taux d'intérêt
+    [0.12, 0.10, 0.06, 0.03, -0.04, 0.80, 0.25, 0.02, 0.03, 0.01, 0.00, 0.10, -0.02, 0.03, 0.08],  # Salaire réel
+    [0.15, 0.08, 0.10, 0.02, -0.06, 0.20, 0.75, 0.02, 0.05, 0.01, 0.00, 0.12, -0.02, 0.02, 0.10],  # Travail
+    [0.04, 0.02, 0.03, 0.04, -0.03, 0.03, 0.02, 0.65, 0.01, 0.00, 0.00, 0.02, 0.03, 0.35, 0.03],   # Exportations nettes
+    [0.03, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.00, 0.70, 0.12, 0.08, 0.02, 0.00, 0.00, 0.04],    # Dépenses publiques
+    [0.04, 0.03, 0.02, 0.03, 0.02, 0.03, 0.02, 0.00, 0.18, 0.75, 0.12, 0.03, 0.00, 0.00, 0.05],    # Recettes fiscales
+    [0.02, 0.01, 0.01, 0.02, 0.03, 0.01, 0.01, 0.00, 0.12, 0.08, 0.90, 0.01, 0.02, 0.00, 0.02],    # Dette publique
+    [0.12, 0.06, 0.18, 0.02, -0.12, 0.10, 0.12, 0.02, 0.03, 0.01, 0.00, 0.75, 0.06, 0.03, 0.08],   # Crédit
+    [0.03, 0.02, 0.02, 0.06, 0.12, 0.02, 0.02, 0.02, 0.01, 0.00, 0.02, 0.04, 0.75, 0.08, 0.04],    # Spread bancaire
+    [0.04, 0.02, 0.03, 0.10, 0.06, 0.03, 0.02, 0.35, 0.00, 0.00, 0.00, 0.03, 0.06, 0.75, 0.04],    # Taux change réel
+    [0.12, 0.08, 0.06, 0.08, 0.10, 0.08, 0.10, 0.03, 0.03, 0.02, 0.01, 0.08, 0.03, 0.04, 0.70]     # Output gap
+], dtype=np.float32)
+# Partagée entre toutes les sessions : lecture seule, en cohérence avec sa forme CSR ci-dessous
+_A_TRANSITION.flags.writeable = False
+
+# Format creux (CSR) pour le noyau IRF, qui ignore ainsi les coefficients nuls
+_A_CSR = csr_matrix(_A_TRANSITION)
+
+# Coefficients non nuls pondérés par la persistance (t < 8 puis t >= 8)
+_A_08_DATA = 0.8 * _A_CSR.data
+_A_09_DATA = 0.9 * _A_CSR.data
+
+# Signature explicite du noyau IRF : compilation anticipée, sans re-spécialisation si un type dérive
+_IRF_KERNEL_SIGNATURE = 'float32[:, :, ::1](int32[::1], int32[::1], float32[::1], float32[::1], int64)'
+
+def _irf_propagators(indptr, indices, data_early, data_late, periods):
+    """Calcule les propagateurs P[t] = A_p @ P[t-1] de la réponse impulsionnelle (A au format CSR)"""
+    n = indptr.shape[0] - 1
+    P = np.zeros((periods, n, n), dtype=data_early.dtype)
+    if periods > 1:
+        for i in range(n):
+            P[1, i, i] = 1.0
+    for t in range(2, periods):
+        # Persistance plus faible sur les premiers trimestres
+        data = data_early if t < 8 else data_late
+        for i in range(n):
+            for p in range(indptr[i], indptr[i+1]):
+                k = indices[p]
+                a = data[p]
+                for j in range(n):
+                    P[t, i, j] += a * P[t-1, k, j]
+    return P
+
+@st.cache_resource
+def _irf_kernel():
+    """Noyau IRF compilé par Numba, une seule fois par processus (et mis en cache sur disque)"""
+    return njit(_IRF_KERNEL_SIGNATURE, cache=True, fastmath=True)(_irf_propagators)
+
+# Compilation dès l'import, pour que la première interaction ne paie pas le JIT
+_irf_kernel()
+
+# Indices des variables d'état dans le vecteur du modèle
+_STATE_INDEX = {name: i for i, name in enumerate(
+    ['Y', 'C', 'I', 'PI', 'R', 'W', 'L', 'NX', 'G', 'TAU', 'DEBT', 'CR', 'SPREAD', 'RER', 'YGAP'])}
+
+def _shock_pattern(**loadings):
+    """Vecteur d'impact d'un choc unitaire sur les variables d'état"""
+    vec = np.zeros(len(_STATE_INDEX), dtype=np.float32)
+    for var, coef in loadings.items():
+        vec[_STATE_INDEX[var]] = coef
+    return vec
+
+def _episode_template(shocks, episodes, max_periods):
+    """Matrice (chocs x périodes) des épisodes historiques, dans l'ordre de shocks"""
+    template = np.zeros((len(shocks), max_periods))
+    for row, shock in enumerate(shocks):
+        for start, stop, first, last in episodes.get(shock, []):
+            template[row, start:stop] = np.linspace(first, last, stop - start)
+    return template
 
 class CompleteDSGEModelCameroon:
+    # Canaux de transmission de chaque choc structurel (effet d'un choc unitaire)
+    _SHOCK_PATTERNS = {
+        # Choc monétaire : TIAO, effets sur le crédit et l'investissement
+        'monetary': _shock_pattern(R=1.0, CR=-0.8, I=-0.6),
+        # Choc budgétaire : dépenses publiques, multiplicateur et dette
+        'fiscal': _shock_pattern(G=1.0, Y=0.6, DEBT=0.8),
+        # Choc de productivité : salaires et effet désinflationniste
+        'productivity': _shock_pattern(Y=1.0, W=0.7, PI=-0.3),
+        # Choc de risque : effet fort sur le crédit et le taux de change
+        'risk': _shock_pattern(SPREAD=1.0, CR=-0.9, RER=0.5),
+        # Choc pétrolier : balance commerciale, inflation et PIB
+        'oil_price': _shock_pattern(NX=0.8, PI=0.4, Y=0.3),
+        # Choc de préférence : consommation, offre de travail et salaires
+        'preference': _shock_pattern(C=1.0, L=-0.5, W=0.3),
+        # Choc d'investissement : effet multiplicateur et hausse du crédit
+        'investment': _shock_pattern(I=1.0, Y=0.7, CR=0.6),
+        # Choc de marge : pression inflationniste, effet récessif, baisse des salaires réels
+        'markup': _shock_pattern(PI=1.0, Y=-0.4, W=-0.2),
+        # Choc de règle monétaire : déviation forte du taux
+        'monetary_policy': _shock_pattern(R=1.2, YGAP=-0.5, PI=-0.3),
+        # Choc de règle budgétaire : recettes et ajustement des dépenses
+        'fiscal_rule': _shock_pattern(TAU=1.0, G=-0.5, DEBT=-0.3),
+        # Choc externe : taux de change, contagion des taux et balance commerciale
+        'external': _shock_pattern(RER=1.0, R=0.3, NX=-0.4),
+        # Choc financier : crunch du crédit
+        'financial': _shock_pattern(CR=-1.0, SPREAD=1.5, I=-0.8),
+    }
+    
+    # Mêmes canaux empilés en matrice (chocs x variables) pour la sélection groupée par indices
+    _SHOCK_ROWS = {shock: row for row, shock in enumerate(_SHOCK_PATTERNS)}
+    _SHOCK_MATRIX = np.stack(list(_SHOCK_PATTERNS.values()))
+    
+    # Épisodes historiques par choc depuis 2015T1 : (début, fin, valeur initiale, valeur finale)
+    _HISTORICAL_EPISODES = {
+        # Choc pétrolier 2015-2016, puis reprise 2021-2022
+        'oil_price': [(0, 8, -0.3, -0.1), (16, 20, 0.2, 0.4)],
+        # Assouplissement COVID-19, puis resserrement 2023
+        'monetary': [(12, 16, -0.4, -0.2), (18, 20, 0.1, 0.3)],
+        # Plan de relance COVID-19, puis consolidation budgétaire
+        'fiscal': [(12, 16, 0.3, 0.5), (18, 20, -0.1, -0.2)],
+        # Pic de risque COVID-19
+        'risk': [(12, 14, 0.4, 0.6)],
+    }
+    # Largeur du gabarit précalculé ; au-delà, les contributions déterministes sont nulles
+    _HISTORICAL_TEMPLATE_PERIODS = 60
+    _HISTORICAL_TEMPLATE = _episode_template(list(_SHOCK_PATTERNS), _HISTORICAL_EPISODES,
+                                             _HISTORICAL_TEMPLATE_PERIODS)
+    
     def __init__(self):
         # Paramètres avec distributions a posteriori étendus
         self.param_distributions = {
@@ -151,110 +285,48 @@ class CompleteDSGEModelCameroon:
         
     def simulate_shock(self, shock_type, shock_size, periods=40):
         """Simule différents types de chocs avec tous les chocs structurels"""
-        # Initialisation des variables
-        n_vars = 15
-        X = np.zeros((n_vars, periods))
-        A = self._build_transition_matrix()
-        shock_vec = np.zeros(n_vars)
+        # Application du choc selon le type avec des canaux spécifiques
+        # (amplitude convertie en float32 pour ne pas promouvoir le tenseur en float64)
+        shock_vec = np.float32(shock_size) * self._SHOCK_PATTERNS[shock_type]
         
-        # Définition des indices des variables
-        Y, C, I, PI, R, W, L, NX, G, TAU, DEBT, CR, SPREAD, RER, YGAP = range(15)
+        # Simulation avec persistance : X[t] = P[t] @ shock_vec, une ligne contiguë par période,
+        # calculée en un seul produit matrice-vecteur sur le tenseur aplati (periods*15, 15)
+        P = propagation_tensor(periods)
+        X = (P.reshape(-1, P.shape[2]) @ shock_vec).reshape(periods, P.shape[1])
         
-        # Application du choc selon le type avec des canaux spécifiques
-        if shock_type == "monetary":
-            # Choc monétaire : TIAO
-            shock_vec[R] = shock_size
-            shock_vec[CR] = -shock_size * 0.8  # Effet sur le crédit
-            shock_vec[I] = -shock_size * 0.6   # Effet sur l'investissement
-            
-        elif shock_type == "fiscal":
-            # Choc budgétaire : dépenses publiques
-            shock_vec[G] = shock_size
-            shock_vec[Y] = shock_size * 0.6    # Multiplicateur budgétaire
-            shock_vec[DEBT] = shock_size * 0.8 # Effet sur la dette
-            
-        elif shock_type == "productivity":
-            # Choc de productivité
-            shock_vec[Y] = shock_size
-            shock_vec[W] = shock_size * 0.7    # Effet sur les salaires
-            shock_vec[PI] = -shock_size * 0.3  # Effet désinflationniste
-            
-        elif shock_type == "risk":
-            # Choc de risque
-            shock_vec[SPREAD] = shock_size
-            shock_vec[CR] = -shock_size * 0.9  # Effet fort sur le crédit
-            shock_vec[RER] = shock_size * 0.5  # Effet sur le taux de change
-            
-        elif shock_type == "oil_price":
-            # Choc pétrolier
-            shock_vec[NX] = shock_size * 0.8   # Amélioration balance commerciale
-            shock_vec[PI] = shock_size * 0.4   # Pression inflationniste
-            shock_vec[Y] = shock_size * 0.3    # Effet positif sur le PIB
-            
-        elif shock_type == "preference":
-            # Choc de préférence
-            shock_vec[C] = shock_size          # Hausse consommation
-            shock_vec[L] = -shock_size * 0.5   # Baisse offre de travail
-            shock_vec[W] = shock_size * 0.3    # Hausse salaires
-            
-        elif shock_type == "investment":
-            # Choc d'investissement
-            shock_vec[I] = shock_size
-            shock_vec[Y] = shock_size * 0.7    # Effet multiplicateur
-            shock_vec[CR] = shock_size * 0.6   # Hausse du crédit
-            
-        elif shock_type == "markup":
-            # Choc de marge
-            shock_vec[PI] = shock_size         # Pression inflationniste
-            shock_vec[Y] = -shock_size * 0.4   # Effet récessif
-            shock_vec[W] = -shock_size * 0.2   # Baisse salaires réels
-            
-        elif shock_type == "monetary_policy":
-            # Choc de règle monétaire
-            shock_vec[R] = shock_size * 1.2    # Déviation forte
-            shock_vec[YGAP] = -shock_size * 0.5
-            shock_vec[PI] = -shock_size * 0.3
-            
-        elif shock_type == "fiscal_rule":
-            # Choc de règle budgétaire
-            shock_vec[TAU] = shock_size        # Variation des recettes
-            shock_vec[G] = -shock_size * 0.5   # Ajustement des dépenses
-            shock_vec[DEBT] = -shock_size * 0.3
-            
-        elif shock_type == "external":
-            # Choc externe
-            shock_vec[RER] = shock_size        # Variation taux change
-            shock_vec[R] = shock_size * 0.3    # Contagion taux intérêt
-            shock_vec[NX] = -shock_size * 0.4  # Effet balance commerciale
-            
-        elif shock_type == "financial":
-            # Choc financier
-            shock_vec[CR] = -shock_size        # Crunch du crédit
-            shock_vec[SPREAD] = shock_size * 1.5
-            shock_vec[I] = -shock_size * 0.8
-            
-        # Simulation avec persistance
-        for t in range(1, periods):
-            if t == 1:
-                X[:, t] = A @ np.zeros(n_vars) + shock_vec
-            else:
-                # Ajout de persistance spécifique au choc
-                persistence = 0.8 if t < 8 else 0.9
-                X[:, t] = A @ X[:, t-1] * persistence
+        return self._irf_dataframe(X)
+    
+    def simulate_shocks_batch(self, shock_specs, periods=40):
+        """Simule plusieurs scénarios (type de choc, amplitude) en un seul produit matriciel"""
+        # Une colonne de chocs par scénario : (15, K), sélectionnée en une indexation groupée
+        rows = [self._SHOCK_ROWS[shock_type] for shock_type, _ in shock_specs]
+        sizes = np.array([shock_size for _, shock_size in shock_specs], dtype=np.float32)
+        shocks = self._SHOCK_MATRIX[rows].T * sizes
         
+        P = propagation_tensor(periods)
+        trajectories = (P.reshape(-1, P.shape[2]) @ shocks).reshape(periods, P.shape[1], len(shock_specs))
+        
+        return [self._irf_dataframe(trajectories[:, :, k]) for k in range(len(shock_specs))]
+    
+    def _irf_dataframe(self, X):
+        """Met en forme une trajectoire (périodes x variables) en DataFrame"""
         variables = ['PIB', 'Consommation', 'Investissement', 'Inflation', 'Taux_Interet',
                     'Salaire_Reel', 'Travail', 'Exportations_Nettes', 'Depenses_Publiques',
                     'Recettes_Fiscales', 'Dette_Publique', 'Credit', 'Spread_Bancaire',
                     'Taux_Change_Reel', 'Output_Gap']
         
-        df = pd.DataFrame(X.T, columns=variables)
-        df['Periode'] = range(periods)
+        # Colonnes construites comme vues sur X, sans copie ni consolidation
+        data = dict(zip(variables, X.T))
+        data['Periode'] = np.arange(X.shape[0], dtype=np.int32)
+        df = pd.DataFrame(data, copy=False)
         
         return df
     
     def generate_variance_decomposition(self, horizon=20):
         """Génère la décomposition de variance avec tous les chocs"""
-        np.random.seed(42)
+        # Générateur local : la graine fixe ne sert qu'à stabiliser les graphiques affichés,
+        # sans modifier l'état aléatoire global partagé entre sessions
+        rng = np.random.default_rng(42)
         
         n_shocks = len(self.structural_shocks)
         shock_names = list(self.structural_shocks.keys())
@@ -284,11 +356,11 @@ class CompleteDSGEModelCameroon:
         contributions[3, shock_names.index('risk')] = 0.04
         
         # Ajouter du bruit pour réalisme
-        contributions += np.random.uniform(-0.02, 0.02, contributions.shape)
-        contributions = np.clip(contributions, 0, 1)
+        contributions += rng.uniform(-0.02, 0.02, contributions.shape)
+        np.clip(contributions, 0, 1, out=contributions)
         
-        # Normaliser les lignes à 1
-        contributions = contributions / contributions.sum(axis=1, keepdims=True)
+        # Normaliser les lignes à 1 (en place)
+        contributions /= contributions.sum(axis=1, keepdims=True)
         
         var_decomp_df = pd.DataFrame(
             contributions,
@@ -303,51 +375,29 @@ class CompleteDSGEModelCameroon:
     
     def generate_historical_decomposition(self, periods=20):
         """Génère la décomposition historique réaliste"""
-        np.random.seed(42)
+        # Graine fixe pour des épisodes reproductibles d'une exécution à l'autre
+        rng = np.random.default_rng(42)
         
         dates = pd.date_range('2015-01-01', periods=periods, freq='Q')
-        shock_names = list(self.structural_shocks.keys())
+        shock_names = list(self._SHOCK_PATTERNS)
         
-        historical_data = {}
+        # Épisodes historiques précalculés, une ligne par choc (zéros au-delà du gabarit)
+        contributions = np.zeros((len(shock_names), periods))
+        span = min(periods, self._HISTORICAL_TEMPLATE_PERIODS)
+        contributions[:, :span] = self._HISTORICAL_TEMPLATE[:, :span]
         
-        # Simulation d'épisodes historiques réalistes
-        for shock in shock_names:
-            base_series = np.zeros(periods)
-            
-            # Épisodes spécifiques selon le type de choc
-            if shock == 'oil_price':
-                # Choc pétrolier 2015-2016
-                base_series[0:8] = np.linspace(-0.3, -0.1, 8)
-                # Reprise 2021-2022
-                base_series[16:20] = np.linspace(0.2, 0.4, 4)
-                
-            elif shock == 'monetary':
-                # Assouplissement COVID-19
-                base_series[12:16] = np.linspace(-0.4, -0.2, 4)
-                # Resserrement 2023
-                base_series[18:20] = np.linspace(0.1, 0.3, 2)
-                
-            elif shock == 'fiscal':
-                # Plan de relance COVID-19
-                base_series[12:16] = np.linspace(0.3, 0.5, 4)
-                # Consolidation budgétaire
-                base_series[18:20] = np.linspace(-0.1, -0.2, 2)
-                
-            elif shock == 'productivity':
-                # Tendances de long terme avec fluctuations
-                base_series = np.cumsum(np.random.normal(0.01, 0.02, periods))
-                
-            elif shock == 'risk':
-                # Pic de risque COVID-19
-                base_series[12:14] = np.linspace(0.4, 0.6, 2)
-                
-            historical_data[self.structural_shocks[shock]['name']] = base_series
+        # Productivité : tendances de long terme avec fluctuations
+        contributions[shock_names.index('productivity')] = np.cumsum(
+            0.01 + 0.02 * rng.standard_normal(periods))
+        
+        historical_data = {
+            self.structural_shocks[shock]['name']: contributions[i]
+            for i, shock in enumerate(shock_names)
+        }
         
         # PIB observé comme somme des contributions
         historical_data['PIB Observé'] = 100 + np.cumsum(
-            np.random.normal(0.02, 0.015, periods) + 
-            np.sum([historical_data[shock] for shock in historical_data.keys() 
-                   if shock != 'PIB Observé'], axis=0) * 0.3
+            0.02 + 0.015 * rng.standard_normal(periods) + contributions.sum(axis=0) * 0.3
         )
         
         historical_data['Date'] = dates
@@ -357,50 +407,69 @@ class CompleteDSGEModelCameroon:
     
     def generate_posterior_distributions(self, n_draws=1000):
         """Génère les distributions a posteriori pour tous les paramètres"""
-        posterior_samples = {}
+        # Graine fixe pour des histogrammes reproductibles
+        rng = np.random.default_rng(42)
         
+        # Regroupement des paramètres par famille de loi : un seul tirage par famille
+        families = {}
         for param, config in self.param_distributions.items():
-            if config['dist'] == 'beta':
-                alpha = config['mean'] * 20
-                beta = (1 - config['mean']) * 20
-                samples = np.random.beta(alpha, beta, n_draws)
-            elif config['dist'] == 'gamma':
-                shape = (config['mean'] / config['std'])**2
-                scale = config['std']**2 / config['mean']
-                samples = np.random.gamma(shape, scale, n_draws)
+            families.setdefault(config['dist'], []).append(param)
+        
+        draws = {}
+        for dist, params in families.items():
+            means = np.array([self.param_distributions[p]['mean'] for p in params])
+            stds = np.array([self.param_distributions[p]['std'] for p in params])
+            size = (n_draws, len(params))
+            
+            if dist == 'beta':
+                samples = rng.beta(means * 20, (1 - means) * 20, size)
+            elif dist == 'gamma':
+                samples = rng.gamma((means / stds)**2, stds**2 / means, size)
             else:
-                samples = np.random.normal(config['mean'], config['std'], n_draws)
+                samples = rng.normal(means, stds, size)
             
-            posterior_samples[param] = {
-                'samples': samples,
+            for i, param in enumerate(params):
+                draws[param] = samples[:, i]
+        
+        posterior_samples = {
+            param: {
+                'samples': draws[param],
                 'description': config['description']
             }
+            for param, config in self.param_distributions.items()
+        }
         
         return posterior_samples
     
     def _build_transition_matrix(self):
         """Matrice de transition améliorée avec canaux spécifiques"""
-        # Matrice 15x15 avec structure économiquement cohérente
-        A = np.array([
-            # PIB, Cons, Inv, Inf, Taux, Sal, Trav, NX, Dep, Tax, Dette, Créd, Spr, TCR, OG
-            [0.85, 0.15, 0.20, -0.05, -0.12, 0.08, 0.12, 0.05, 0.08, 0.02, -0.01, 0.15, -0.03, 0.06, 0.10],  # PIB
-            [0.25, 0.75, 0.08, -0.03, -0.08, 0.12, 0.06, 0.02, 0.04, -0.02, 0.00, 0.08, -0.02, 0.03, 0.05],  # Consommation
-            [0.15, 0.05, 0.65, -0.02, -0.15, 0.10, 0.15, 0.03, 0.06, -0.01, 0.00, 0.25, -0.04, 0.04, 0.08],  # Investissement
-            [0.08, 0.03, 0.02, 0.55, 0.20, 0.05, 0.03, 0.02, 0.04, 0.02, 0.02, 0.03, 0.08, 0.12, 0.06],     # Inflation
-            [0.06, 0.02, 0.02, 0.25, 0.75, 0.02, 0.02, 0.01, 0.02, 0.01, 0.02, 0.02, 0.12, 0.08, 0.15],     # Taux d'intérêt
-            [0.12, 0.10, 0.06, 0.03, -0.04, 0.80, 0.25, 0.02, 0.03, 0.01, 0.00, 0.10, -0.02, 0.03, 0.08],  # Salaire réel
-            [0.15, 0.08, 0.10, 0.02, -0.06, 0.20, 0.75, 0.02, 0.05, 0.01, 0.00, 0.12, -0.02, 0.02, 0.10],  # Travail
-            [0.04, 0.02, 0.03, 0.04, -0.03, 0.03, 0.02, 0.65, 0.01, 0.00, 0.00, 0.02, 0.03, 0.35, 0.03],   # Exportations nettes
-            [0.03, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.00, 0.70, 0.12, 0.08, 0.02, 0.00, 0.00, 0.04],    # Dépenses publiques
-            [0.04, 0.03, 0.02, 0.03, 0.02, 0.03, 0.02, 0.00, 0.18, 0.75, 0.12, 0.03, 0.00, 0.00, 0.05],    # Recettes fiscales
-            [0.02, 0.01, 0.01, 0.02, 0.03, 0.01, 0.01, 0.00, 0.12, 0.08, 0.90, 0.01, 0.02, 0.00, 0.02],    # Dette publique
-            [0.12, 0.06, 0.18, 0.02, -0.12, 0.10, 0.12, 0.02, 0.03, 0.01, 0.00, 0.75, 0.06, 0.03, 0.08],   # Crédit
-            [0.03, 0.02, 0.02, 0.06, 0.12, 0.02, 0.02, 0.02, 0.01, 0.00, 0.02, 0.04, 0.75, 0.08, 0.04],    # Spread bancaire
-            [0.04, 0.02, 0.03, 0.10, 0.06, 0.03, 0.02, 0.35, 0.00, 0.00, 0.00, 0.03, 0.06, 0.75, 0.04],    # Taux change réel
-            [0.12, 0.08, 0.06, 0.08, 0.10, 0.08, 0.10, 0.03, 0.03, 0.02, 0.01, 0.08, 0.03, 0.04, 0.70]     # Output gap
-        ])
-        
-        return A
+        return _A_TRANSITION
+
+def signed_absmax(values):
+    """Valeur de plus grande amplitude d'une série, avec son signe"""
+    values = np.asarray(values)
+    return values[np.abs(values).argmax()]
+
+def irf_key_metrics(df_simulation):
+    """Indicateurs clés d'une réponse impulsionnelle, calculés une seule fois sur les tableaux NumPy"""
+    pib = df_simulation['PIB'].to_numpy()
+    pib_max = signed_absmax(pib)
+    
+    return {
+        'pib_max': pib_max,
+        'inflation_max': signed_absmax(df_simulation['Inflation'].to_numpy()),
+        'credit_8': df_simulation['Credit'].to_numpy()[8],
+        'persistence': int((np.abs(pib) > 0.01 * abs(pib_max)).sum()),
+    }
+
+# Gabarit HTML de la carte descriptive d'un choc
+_SHOCK_CARD_TPL = string.Template("""
+<div class='shock-card' style='border-left-color: $color'>
+    <h4>$name</h4>
+    <p>$description</p>
+    <p><strong>Variables principales affectées:</strong> $variables</p>
+</div>
+""")
 
 def create_shock_selection_interface():
     """Crée une interface de sélection des chocs avec descriptions"""
@@ -438,16 +507,180 @@ def create_shock_selection_interface():
     with col2:
         # Carte descriptive du choc sélectionné
         shock_info = complete_model.structural_shocks[shock_type]
-        st.markdown(f"""
-        <div class='shock-card' style='border-left-color: {shock_info["color"]}'>
-            <h4>{shock_info['name']}</h4>
-            <p>{shock_info['description']}</p>
-            <p><strong>Variables principales affectées:</strong> {', '.join(shock_info['variables'])}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SHOCK_CARD_TPL.substitute(
+            color=shock_info['color'],
+            name=shock_info['name'],
+            description=shock_info['description'],
+            variables=', '.join(shock_info['variables'])
+        ), unsafe_allow_html=True)
     
     return shock_type, shock_size, periods
 
+@st.cache_resource(show_spinner=False, max_entries=16)
+def propagation_tensor(periods):
+    """Propagateurs P[t] de la réponse impulsionnelle, calculés une fois par horizon pour tous les chocs"""
+    P = _irf_kernel()(_A_CSR.indptr, _A_CSR.indices, _A_08_DATA, _A_09_DATA, periods)
+    # Tenseur partagé entre sessions : lecture seule
+    P.flags.writeable = False
+    return P
+
+@st.cache_resource
+def get_model():
+    """Instance unique du modèle, conservée entre les réexécutions du script"""
+    return CompleteDSGEModelCameroon()
+
+@st.cache_data(show_spinner=False)
+def cached_simulate_shock(_model, shock_type, shock_size, periods):
+    """Simulation d'un choc, mise en cache selon ses paramètres"""
+    return _model.simulate_shock(shock_type, shock_size, periods)
+
+@st.cache_data(show_spinner=False)
+def cached_simulate_shocks_batch(_model, shock_specs, periods):
+    """Simulation groupée de plusieurs scénarios, mise en cache selon leurs paramètres"""
+    return _model.simulate_shocks_batch(shock_specs, periods)
+
+@st.cache_data(show_spinner=False)
+def simulation_to_csv(df_simulation):
+    """Export CSV d'une simulation, recalculé seulement quand la simulation change"""
+    return df_simulation.to_csv(index=False, float_format='%.6g').encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def cached_variance_decomposition(_model, horizon):
+    """Décomposition de variance, mise en cache selon l'horizon"""
+    return _model.generate_variance_decomposition(horizon)
+
+@st.cache_data(show_spinner=False)
+def cached_historical_decomposition(_model, periods):
+    """Décomposition historique, mise en cache selon le nombre de périodes"""
+    return _model.generate_historical_decomposition(periods)
+
+@st.cache_data(show_spinner=False)
+def cached_posterior_distributions(_model, n_draws):
+    """Tirages a posteriori, mis en cache selon le nombre de tirages"""
+    return _model.generate_posterior_distributions(n_draws)
+
+# Nombre maximal de figures conservées par session
+_FIGURE_CACHE_SIZE = 32
+
+def cached_figure(key, build):
+    """Figure Plotly mémorisée dans la session (LRU borné), reconstruite seulement si ses entrées changent"""
+    cache = st.session_state.setdefault('figure_cache', OrderedDict())
+    if key in cache:
+        cache.move_to_end(key)
+    else:
+        cache[key] = build()
+        if len(cache) > _FIGURE_CACHE_SIZE:
+            cache.popitem(last=False)
+    return cache[key]
+
+# Styles de traits partagés par les figures (lus seulement par Plotly)
+_STACK_LINE = {'width': 0.5}
+_OBSERVED_LINE = {'color': 'black', 'width': 3, 'dash': 'dash'}
+_MEAN_LINE = {'color': 'red', 'dash': 'dash'}
+
+def build_irf_figure(df_simulation, shock_info):
+    """Graphique des réponses impulsionnelles des variables clés d'un choc"""
+    periods = df_simulation['Periode'].to_numpy()
+    fig_irf = go.Figure(data=[
+        go.Scattergl(x=periods, y=df_simulation[var].to_numpy(), mode='lines', name=var)
+        for var in shock_info['variables']
+    ])
+    fig_irf.update_layout(title=f"Réponse des Variables Clés au {shock_info['name']}",
+                          xaxis_title="Periode", height=500, template="plotly_white")
+    
+    return fig_irf
+
+def build_comparison_figure(scenarios, variable):
+    """Graphique comparant la réponse d'une variable sous plusieurs scénarios de chocs"""
+    fig_cmp = go.Figure(data=[
+        go.Scattergl(x=df['Periode'].to_numpy(), y=df[variable].to_numpy(), mode='lines', name=name)
+        for name, df in scenarios
+    ])
+    fig_cmp.update_layout(title=f"Comparaison des Scénarios : {variable}",
+                          xaxis_title="Periode", height=450, template="plotly_white")
+    
+    return fig_cmp
+
+def build_variance_figure(var_decomp_df, horizon):
+    """Carte de chaleur de la décomposition de variance"""
+    fig_var = go.Figure(go.Heatmap(z=var_decomp_df.values.T * 100,
+                                   x=var_decomp_df.index, y=var_decomp_df.columns,
+                                   colorscale='Blues'))
+    fig_var.update_layout(title=f"Décomposition de Variance à l'Horizon {horizon} Trimestres (%)",
+                          height=600)
+    fig_var.update_yaxes(autorange='reversed')
+    
+    return fig_var
+
+def build_historical_figure(historical_df):
+    """Graphique empilé de la décomposition historique du PIB"""
+    fig_hist = go.Figure()
+    
+    shock_names = [name for name in historical_df.columns if name not in ['Date', 'PIB Observé']]
+    colors = px.colors.qualitative.Set3
+    dates = historical_df['Date'].to_numpy()
+    
+    fig_hist.add_traces([
+        go.Scatter(
+            name=shock,
+            x=dates,
+            y=historical_df[shock].to_numpy(),
+            stackgroup='one',
+            line=_STACK_LINE,
+            fillcolor=colors[i % len(colors)]
+        )
+        for i, shock in enumerate(shock_names)
+    ])
+    
+    fig_hist.add_trace(go.Scatter(
+        name='PIB Observé',
+        x=dates,
+        y=historical_df['PIB Observé'].to_numpy(),
+        line=_OBSERVED_LINE
+    ))
+    
+    fig_hist.update_layout(
+        title="Décomposition Historique du PIB Camerounais",
+        xaxis_title="Date",
+        yaxis_title="Contribution cumulée",
+        height=500,
+        showlegend=True
+    )
+    
+    return fig_hist
+
+def build_posterior_figure(posterior_data):
+    """Histogrammes des distributions a posteriori des paramètres"""
+    params = list(posterior_data)
+    cols = 3
+    rows = (len(params) + cols - 1) // cols
+    
+    # Format long : une seule série de tirages, facettée par paramètre
+    samples = [data['samples'] for data in posterior_data.values()]
+    long_df = pd.DataFrame({
+        'value': np.concatenate(samples),
+        'param': np.repeat(params, [len(x) for x in samples])
+    })
+    
+    fig_post = px.histogram(long_df, x='value', facet_col='param', facet_col_wrap=cols,
+                            category_orders={'param': params})
+    # Classes calculées sur chaque paramètre, et non sur l'ensemble des tirages
+    fig_post.update_traces(bingroup=None)
+    fig_post.update_xaxes(matches=None, showticklabels=True, title_text=None)
+    fig_post.update_yaxes(matches=None, showticklabels=True, title_text=None)
+    fig_post.for_each_annotation(lambda a: a.update(text=a.text.split('=', 1)[-1]))
+    
+    # Valeur moyenne (une trace par facette, dans l'ordre des paramètres)
+    for trace, data in zip(fig_post.data, samples):
+        fig_post.add_shape(type='line', x0=np.mean(data), x1=np.mean(data), y0=0, y1=1,
+                           xref=trace.xaxis, yref=f"{trace.yaxis} domain",
+                           line=_MEAN_LINE)
+    
+    fig_post.update_layout(height=300 * rows, title_text="Distributions a Posteriori des Paramètres",
+                           showlegend=False)
+    
+    return fig_post
+
 def main():
     # En-tête moderne
     st.markdown('<h1 class="main-header">🏦 Simulateur DSGE Cameroun-BEAC - Modèle Complet</h1>', 
@@ -470,7 +703,7 @@ def main():
     
     # Initialisation du modèle complet
     global complete_model
-    complete_model = CompleteDSGEModelCameroon()
+    complete_model = get_model()
     
     with tab1:
         st.markdown("## ⚡ Simulations des Chocs Structurels")
@@ -480,33 +713,67 @@ def main():
         
         # Simulation
         with st.spinner(f"🚀 Simulation du choc {complete_model.structural_shocks[shock_type]['name']}..."):
-            df_simulation = complete_model.simulate_shock(shock_type, shock_size, periods)
+            df_simulation = cached_simulate_shock(complete_model, shock_type, shock_size, periods)
         
         # Métriques clés
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            max_pib_impact = df_simulation['PIB'].max() if df_simulation['PIB'].max() > abs(df_simulation['PIB'].min()) else df_simulation['PIB'].min()
-            st.metric("Impact Max sur PIB", f"{max_pib_impact:+.3f}")
-        
-        with col2:
-            max_inflation_impact = df_simulation['Inflation'].max() if df_simulation['Inflation'].max() > abs(df_simulation['Inflation'].min()) else df_simulation['Inflation'].min()
-            st.metric("Impact Max sur Inflation", f"{max_inflation_impact:+.3f} pp")
-        
-        with col3:
-            credit_impact = df_simulation['Credit'].iloc[8]
-            st.metric("Impact Crédit (période 8)", f"{credit_impact:+.3f}")
-        
-        with col4:
-            persistence = len(df_simulation[df_simulation['PIB'].abs() > 0.01 * abs(max_pib_impact)])
-            st.metric("Persistence (périodes)", persistence)
+        metrics = irf_key_metrics(df_simulation)
+        metric_cards = [
+            ("Impact Max sur PIB", f"{metrics['pib_max']:+.3f}"),
+            ("Impact Max sur Inflation", f"{metrics['inflation_max']:+.3f} pp"),
+            ("Impact Crédit (période 8)", f"{metrics['credit_8']:+.3f}"),
+            ("Persistence (périodes)", metrics['persistence']),
+        ]
+        for col, (label, value) in zip(st.columns(len(metric_cards)), metric_cards):
+            col.metric(label, value)
         
         # Graphique IRF
         shock_info = complete_model.structural_shocks[shock_type]
-        fig_irf = px.line(df_simulation, x='Periode', y=shock_info['variables'],
-                         title=f"Réponse des Variables Clés au {shock_info['name']}")
-        fig_irf.update_layout(height=500, template="plotly_white")
+        fig_irf = cached_figure(('irf', shock_type, shock_size, periods),
+                                lambda: build_irf_figure(df_simulation, shock_info))
         st.plotly_chart(fig_irf, use_container_width=True)
+        
+        # Export des données de simulation
+        st.download_button(
+            "📥 Télécharger la simulation (CSV)",
+            data=simulation_to_csv(df_simulation),
+            file_name=f"simulation_{shock_type}.csv",
+            mime="text/csv"
+        )
+        
+        # Comparaison de scénarios
+        with st.expander("🔀 Comparaison de Scénarios"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                compare_shock = st.selectbox(
+                    "Choc à comparer",
+                    options=list(complete_model.structural_shocks.keys()),
+                    format_func=lambda x: complete_model.structural_shocks[x]['name'],
+                    key="compare_selector"
+                )
+            
+            with col2:
+                compare_var = st.selectbox(
+                    "Variable comparée",
+                    options=[col for col in df_simulation.columns if col != 'Periode'],
+                    key="compare_variable"
+                )
+            
+            # État conservé entre les réexécutions : le graphique suit les changements de paramètres
+            if st.checkbox("Comparer les Scénarios", key="compare_enabled"):
+                # Les deux scénarios sont simulés en un seul produit matriciel
+                specs = ((shock_type, shock_size), (compare_shock, shock_size))
+                df_base, df_compare = cached_simulate_shocks_batch(complete_model, specs, periods)
+                
+                fig_cmp = cached_figure(
+                    ('comparison', shock_type, compare_shock, shock_size, periods, compare_var),
+                    lambda: build_comparison_figure(
+                        [(complete_model.structural_shocks[shock_type]['name'], df_base),
+                         (complete_model.structural_shocks[compare_shock]['name'], df_compare)],
+                        compare_var
+                    )
+                )
+                st.plotly_chart(fig_cmp, use_container_width=True)
     
     with tab2:
         st.markdown("## 📊 Décomposition de Variance des Chocs Structurels")
@@ -522,22 +789,21 @@ def main():
         
         horizon = st.slider("Horizon de prévision (trimestres)", 4, 40, 20, 4, key="var_horizon")
         
-        var_decomp_df = complete_model.generate_variance_decomposition(horizon)
+        var_decomp_df = cached_variance_decomposition(complete_model, horizon)
         
         # Graphique de décomposition
-        fig_var = px.imshow(var_decomp_df.T * 100, 
-                           title=f"Décomposition de Variance à l'Horizon {horizon} Trimestres (%)",
-                           color_continuous_scale='Blues',
-                           aspect="auto")
-        fig_var.update_layout(height=600)
+        fig_var = cached_figure(('variance', horizon),
+                                lambda: build_variance_figure(var_decomp_df, horizon))
         st.plotly_chart(fig_var, use_container_width=True)
         
         # Tableau détaillé
         with st.expander("📋 Tableau Détaillé des Contributions"):
-            display_df = var_decomp_df.copy()
-            for col in display_df.columns:
-                display_df[col] = display_df[col].apply(lambda x: f"{x:.1%}")
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                var_decomp_df * 100,
+                column_config={col: st.column_config.NumberColumn(format="%.1f%%")
+                               for col in var_decomp_df.columns},
+                use_container_width=True
+            )
     
     with tab3:
         st.markdown("## 📈 Décomposition Historique des Chocs")
@@ -551,38 +817,10 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        historical_df = complete_model.generate_historical_decomposition(24)
+        historical_df = cached_historical_decomposition(complete_model, 24)
         
         # Graphique de décomposition historique
-        fig_hist = go.Figure()
-        
-        shock_names = [name for name in historical_df.columns if name not in ['Date', 'PIB Observé']]
-        colors = px.colors.qualitative.Set3
-        
-        for i, shock in enumerate(shock_names):
-            fig_hist.add_trace(go.Scatter(
-                name=shock,
-                x=historical_df['Date'],
-                y=historical_df[shock],
-                stackgroup='one',
-                line=dict(width=0.5),
-                fillcolor=colors[i % len(colors)]
-            ))
-        
-        fig_hist.add_trace(go.Scatter(
-            name='PIB Observé',
-            x=historical_df['Date'],
-            y=historical_df['PIB Observé'],
-            line=dict(color='black', width=3, dash='dash')
-        ))
-        
-        fig_hist.update_layout(
-            title="Décomposition Historique du PIB Camerounais",
-            xaxis_title="Date",
-            yaxis_title="Contribution cumulée",
-            height=500,
-            showlegend=True
-        )
+        fig_hist = cached_figure(('historical', 24), lambda: build_historical_figure(historical_df))
         
         st.plotly_chart(fig_hist, use_container_width=True)
     
@@ -600,31 +838,10 @@ def main():
         
         n_draws = st.slider("Nombre de tirages MCMC", 500, 5000, 2000, 500, key="mcmc_draws")
         
-        posterior_data = complete_model.generate_posterior_distributions(n_draws)
+        posterior_data = cached_posterior_distributions(complete_model, n_draws)
         
         # Graphiques des distributions
-        n_params = len(posterior_data)
-        cols = 3
-        rows = (n_params + cols - 1) // cols
-        
-        fig_post = make_subplots(rows=rows, cols=cols, 
-                               subplot_titles=list(posterior_data.keys()))
-        
-        for i, (param, data) in enumerate(posterior_data.items()):
-            row = i // cols + 1
-            col = i % cols + 1
-            
-            fig_post.add_trace(
-                go.Histogram(x=data['samples'], name=param, showlegend=False),
-                row=row, col=col
-            )
-            
-            # Valeur moyenne
-            mean_val = np.mean(data['samples'])
-            fig_post.add_vline(x=mean_val, line_dash="dash", line_color="red",
-                             row=row, col=col)
-        
-        fig_post.update_layout(height=300 * rows, title_text="Distributions a Posteriori des Paramètres")
+        fig_post = cached_figure(('posterior', n_draws), lambda: build_posterior_figure(posterior_data))
         st.plotly_chart(fig_post, use_container_width=True)
         
         # Tableau des statistiques